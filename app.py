@@ -2,262 +2,276 @@
 
 import streamlit as st
 import os
+import asyncio
+import time
+import threading
+import cachetools
 import requests
-import groq
-import wikipedia
-import string
-from urllib.parse import quote_plus
+from requests.adapters import HTTPAdapter
+import diskcache
+import orjson
 from dotenv import load_dotenv
 from datetime import datetime
+from pathlib import Path
+from trip_whisperer.translations import translations, LANGUAGE_OPTIONS
+from trip_whisperer.core import (
+    GUIDE_MODEL,
+    GUIDE_COMPLETION_OPTIONS,
+    GUIDE_CACHE_DIR,
+    GUIDE_CACHE_EXPIRE,
+    build_guide_messages,
+    clean_city_name,
+    generate_flight_search_link,
+    guide_cache_key,
+    is_complete_guide,
+    parse_guide_to_dict,
+)
 
 # --- INITIAL SETUP AND CONFIGURATION ---
 
 load_dotenv()
 
-# Configure Groq API
-try:
-    groq_client = groq.Groq(api_key=os.getenv("GROQ_API_KEY"))
-    if not os.getenv("GROQ_API_KEY"):
-        st.error("Groq API key not found. Please check your .env file.", icon="🚨")
-        st.stop()
-except Exception as e:
-    st.error(f"Error configuring the Groq API. Details: {e}", icon="🚨")
+# Configure Groq API (the async client is opened per request)
+GROQ_API_KEY = os.getenv("GROQ_API_KEY")
+if not GROQ_API_KEY:
+    st.error("Groq API key not found. Please check your .env file.", icon="🚨")
     st.stop()
 
 # Get the Weather API key
 WEATHER_API_KEY = os.getenv("WEATHER_API_KEY")
 
-# --- NEW: TRANSLATIONS DICTIONARY ---
-translations = {
-    "en": {
-        "title": "Trip Whisperer: Your AI Travel Companion ✈️",
-        "placeholder": "e.g., Paris, Tokyo, New York",
-        "button": "Generate Guide",
-        "spinner": "Conjuring a travel guide for {city_name}... ✨",
-        "weather_header": "Current Weather in {city_name}:",
-        "flights_button": "Search for Flights to {city_name}",
-        "summary_header": "A Glimpse into {city_name}",
-        "summary_error": "Could not find a Wikipedia summary for '{city_name}' (language: {lang_code}).",
-        "guide_error": "Could not generate guide. AI model error: {e}",
-        "success": "Your personalized travel guide is ready! Click any item to explore it on Google Maps.",
-        "lang_name": "English",
-        "lang_select": "Select Language",
-        "footer": "Created by Sheikh Imran © 2025. All rights reserved."
-    },
-    "es": {
-        "title": "Susurrador de Viajes: Tu Compañero de IA ✈️",
-        "placeholder": "ej., París, Tokio, Nueva York",
-        "button": "Generar Guía",
-        "spinner": "Conjurando una guía de viaje para {city_name}... ✨",
-        "weather_header": "Tiempo actual en {city_name}:",
-        "flights_button": "Buscar Vuelos a {city_name}",
-        "summary_header": "Un Vistazo a {city_name}",
-        "summary_error": "No se pudo encontrar un resumen de Wikipedia para '{city_name}' (idioma: {lang_code}).",
-        "guide_error": "No se pudo generar la guía. Error del modelo de IA: {e}",
-        "success": "¡Tu guía de viaje personalizada está lista! Haz clic en cualquier elemento para explorarlo en Google Maps.",
-        "lang_name": "Español",
-        "lang_select": "Seleccionar Idioma",
-        "footer": "Creado por Sheikh Imran © 2025. Todos los derechos reservados."
-    },
-    "hi": {
-        "title": "ट्रिप व्हिस्परर: आपका AI यात्रा साथी ✈️",
-        "placeholder": "जैसे, पेरिस, टोक्यो, न्यूयॉर्क",
-        "button": "गाइड तैयार करें",
-        "spinner": "{city_name} के लिए एक यात्रा गाइड तैयार की जा रही है... ✨",
-        "weather_header": "{city_name} में वर्तमान मौसम:",
-        "flights_button": "{city_name} के लिए उड़ानें खोजें",
-        "summary_header": "{city_name} की एक झलक",
-        "summary_error": "'{city_name}' के लिए विकिपीडिया सारांश नहीं मिल सका (भाषा: {lang_code}).",
-        "guide_error": "गाइड उत्पन्न नहीं हो सका। AI मॉडल त्रुटि: {e}",
-        "success": "आपकी व्यक्तिगत यात्रा गाइड तैयार है! Google मानचित्र पर इसका पता लगाने के लिए किसी भी आइटम पर क्लिक करें।",
-        "lang_name": "हिंदी",
-        "lang_select": "भाषा चुनें",
-        "footer": "शेख इमरान द्वारा निर्मित © 2025. सर्वाधिकार सुरक्षित।"
-    },
-    "fr": {
-        "title": "Murmure de Voyage : Votre Compagnon IA ✈️",
-        "placeholder": "ex: Paris, Tokyo, New York",
-        "button": "Générer le Guide",
-        "spinner": "Préparation d'un guide de voyage pour {city_name}... ✨",
-        "weather_header": "Météo actuelle à {city_name} :",
-        "flights_button": "Rechercher des vols vers {city_name}",
-        "summary_header": "Un aperçu de {city_name}",
-        "summary_error": "Impossible de trouver un résumé Wikipedia pour '{city_name}' (langue : {lang_code}).",
-        "guide_error": "Impossible de générer le guide. Erreur du modèle IA : {e}",
-        "success": "Votre guide de voyage personnalisé est prêt ! Cliquez sur un élément pour l'explorer sur Google Maps.",
-        "lang_name": "Français",
-        "lang_select": "Choisir la langue",
-        "footer": "Créé par Sheikh Imran © 2025. Tous droits réservés."
-    }
-}
-
 
 # --- HELPER FUNCTIONS ---
 
-def get_weather_info(city_name, api_key):
+@st.cache_resource
+def get_http_session():
+    """Returns a shared requests.Session that reuses keep-alive HTTPS connections."""
+    session = requests.Session()
+    # One pool per host (OpenWeatherMap, Wikipedia per language), sized for concurrent sessions
+    session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=50))
+    # Wikimedia asks API clients to identify themselves
+    session.headers["User-Agent"] = "TripWhisperer/1.0 (https://github.com/imran786gun/AI-TRIP-WHISPERER)"
+    return session
+
+# Cached for 10 minutes; errors are raised so they are never cached
+@st.cache_data(ttl=600, max_entries=256, show_spinner=False)
+def fetch_weather(city_name, api_key):
     """Fetches real-time weather data from OpenWeatherMap API."""
-    if not api_key:
-        return "Weather API key not configured."
-    
     base_url = "https://api.openweathermap.org/data/2.5/weather"
     params = {
         "q": city_name,
         "appid": api_key,
         "units": "metric"
     }
+    response = get_http_session().get(base_url, params=params, timeout=5)
+    response.raise_for_status()
+    data = orjson.loads(response.content)
+    
+    weather_desc = data['weather'][0]['description'].title()
+    temp = data['main']['temp']
+    feels_like = data['main']['feels_like']
+    humidity = data['main']['humidity']
+    
+    return f"**Weather:** {weather_desc} | **Temp:** {temp}°C | **Feels Like:** {feels_like}°C | **Humidity:** {humidity}%"
+
+def get_weather_info(city_key, city_name, api_key):
+    """Returns the weather line for a city, or a message saying why it is unavailable."""
+    # city_key is looked up and cached; city_name is the user's spelling for messages
+    if not api_key:
+        return "Weather API key not configured."
     try:
-        response = requests.get(base_url, params=params)
-        response.raise_for_status()
-        data = response.json()
-        
-        weather_desc = data['weather'][0]['description'].title()
-        temp = data['main']['temp']
-        feels_like = data['main']['feels_like']
-        humidity = data['main']['humidity']
-        
-        return f"**Weather:** {weather_desc} | **Temp:** {temp}°C | **Feels Like:** {feels_like}°C | **Humidity:** {humidity}%"
-    except requests.exceptions.HTTPError:
-        return f"Could not find weather for '{city_name}'. Please check the city name."
+        return fetch_weather(city_key, api_key)
+    except requests.exceptions.HTTPError as e:
+        # Only a 404 means the city is unknown
+        if e.response is not None and e.response.status_code == 404:
+            return f"Could not find weather for '{city_name}'. Please check the city name."
+        return f"Could not retrieve weather data. Error: {e}"
     except Exception as e:
         return f"Could not retrieve weather data. Error: {e}"
 
-def generate_flight_search_link(city_name):
-    """Generates a pre-filled Google Flights search link."""
-    query = f"flights to {city_name}"
-    encoded_query = quote_plus(query)
-    return f"https://www.google.com/search?q={encoded_query}"
-
 # UPDATED: Now supports different languages
-def get_city_summary(city_name, lang_code, text_dict):
-    """Fetches a concise summary of a city from Wikipedia in the specified language."""
-    try:
-        wikipedia.set_lang(lang_code) 
-        summary = wikipedia.summary(city_name, sentences=3, auto_suggest=True)
-        wikipedia.set_lang("en") # Reset to English for safety
-        return summary
-    except Exception:
-        wikipedia.set_lang("en") 
-        return text_dict["summary_error"].format(city_name=city_name, lang_code=lang_code)
-
-# UPDATED: New prompt for 5 items, new categories, and language support
-def generate_travel_guide(city_name, lang_code, text_dict):
-    """Uses Groq to generate a structured travel guide in the specified language."""
-    
-    lang_name = "English" 
-    for code, texts in translations.items():
-        if code == lang_code:
-            lang_name = texts["lang_name"]
-            break
-
-    prompt = f"""
-    Create a concise and exciting travel guide for "{city_name}".
-    You MUST respond in this language: {lang_name} (language code: {lang_code}).
-    
-    You MUST provide two pieces of information for each item, separated by a pipe |.
-    The format MUST be: [Name in Local Language] | [A brief, 3-sentence description in {lang_name}]
+# Cached for a day; errors are raised so they are never cached
+@st.cache_data(ttl=86400, max_entries=256, show_spinner=False)
+def fetch_city_summary(city_name, lang_code):
+    """Fetches a concise summary of a city from Wikipedia in the specified language, or None if no page matches."""
+    # Searches for the best-matching page and returns its first 3 sentences in one call
+    params = {
+        "action": "query",
+        "format": "json",
+        "formatversion": 2,
+        "generator": "search",
+        "gsrsearch": city_name,
+        "gsrlimit": 1,
+        "prop": "extracts",
+        "exintro": 1,
+        "explaintext": 1,
+        "exsentences": 3,
+        "redirects": 1
+    }
+    response = get_http_session().get(f"https://{lang_code}.wikipedia.org/w/api.php", params=params, timeout=5)
+    response.raise_for_status()
+    # No search hit means no "query"; cached as None
+    pages = orjson.loads(response.content).get("query", {}).get("pages")
+    if not pages:
+        return None
+    return pages[0].get("extract", "").strip() or None
 
-    Example (if user requested 'Paris' and language 'en'):
-    1. Eiffel Tower | A famous 19th-century iron lattice tower. It is one of the most recognizable structures in the world. Visitors can ride an elevator to the top for breathtaking views of the city.
-    
-    Here are the headings to use (translated to {lang_name}). Please provide 5 items for each category:
-    ### Top 5 Tourist Attractions
-    1. [Name] | [A brief, 3-sentence description]
-    2. [Name] | [A brief, 3-sentence description]
-    3. [Name] | [A brief, 3-sentence description]
-    4. [Name] | [A brief, 3-sentence description]
-    5. [Name] | [A brief, 3-sentence description]
-    ### Top 5 Local Dishes to Try
-    1. [Name] | [A brief, 3-sentence description]
-    2. [Name] | [A brief, 3-sentence description]
-    3. [Name] | [A brief, 3-sentence description]
-    4. [Name] | [A brief, 3-sentence description]
-    5. [Name] | [A brief, 3-sentence description]
-    ### Top 5 Things to Avoid
-    1. [Name] | [A brief, 3-sentence description]
-    2. [Name] | [A brief, 3-sentence description]
-    3. [Name] | [A brief, 3-sentence description]
-    4. [Name] | [A brief, 3-sentence description]
-    5. [Name] | [A brief, 3-sentence description]
-    """
+def get_city_summary(city_key, city_name, lang_code):
+    """Returns the Wikipedia summary for a city, or a translated message if there is none."""
     try:
-        response = groq_client.chat.completions.create(
-            model="llama-3.1-8b-instant",
-            messages=[
-                {"role": "system", "content": "You are a helpful travel assistant."},
-                {"role": "user", "content": prompt}
-            ]
+        summary = fetch_city_summary(city_key, lang_code)
+    except (requests.exceptions.RequestException, ValueError):
+        # Network errors, non-200 responses and malformed JSON
+        summary = None
+    return summary or translations[lang_code]["summary_error"].format(city_name=city_name, lang_code=lang_code)
+
+# Streamed guides can't use st.cache_data, so finished ones are kept here for an hour
+@st.cache_resource
+def get_guide_cache():
+    """Returns the process-wide guide cache and the lock guarding it."""
+    return cachetools.TTLCache(maxsize=256, ttl=3600), threading.Lock()
+
+# Persistent second tier, also filled by scripts/warm_cache.py
+@st.cache_resource
+def get_guide_disk_cache():
+    """Opens the SQLite-backed guide cache."""
+    return diskcache.Cache(str(GUIDE_CACHE_DIR))
+
+async def stream_travel_guide(city_name, lang_code):
+    """Uses Groq to stream a structured travel guide, yielding (text, finish_reason) per chunk."""
+    # Imported lazily: the SDK is the slowest import and the landing page doesn't need it
+    import groq
+
+    async with groq.AsyncGroq(api_key=GROQ_API_KEY) as client:
+        stream = await client.chat.completions.create(
+            model=GUIDE_MODEL,
+            messages=build_guide_messages(city_name, lang_code),
+            stream=True,
+            **GUIDE_COMPLETION_OPTIONS
         )
-        return response.choices[0].message.content
+        async for chunk in stream:
+            choice = chunk.choices[0]
+            # finish_reason stays None until the final chunk
+            yield choice.delta.content or "", choice.finish_reason
+
+async def generate_travel_guide(city_name, lang_code, on_update):
+    """Returns the cached or freshly streamed travel guide, passing the text so far to on_update."""
+    key = guide_cache_key(city_name, lang_code)
+    guide_cache, lock = get_guide_cache()
+    disk_cache = get_guide_disk_cache()
+    with lock:
+        guide_text = guide_cache.get(key)
+    if guide_text is None:
+        guide_text = disk_cache.get(key)
+    if guide_text is not None:
+        with lock:
+            guide_cache[key] = guide_text
+        return guide_text
+
+    guide_text = ""
+    finish_reason = None
+    last_update = 0.0
+    try:
+        async for delta, chunk_finish_reason in stream_travel_guide(city_name, lang_code):
+            guide_text += delta
+            finish_reason = chunk_finish_reason or finish_reason
+            # Redraws are capped at about 20 a second
+            now = time.monotonic()
+            if now - last_update >= 0.05:
+                on_update(guide_text)
+                last_update = now
     except Exception as e:
-        return text_dict["guide_error"].format(e=e)
-
-# UPDATED: Parser now handles the new [Name] | [Description] format
-def parse_guide_to_dict(guide_text):
-    """Parses the raw text output from the AI into a structured dictionary."""
-    guide_dict = {}
-    sections = guide_text.split('### ')[1:]
-    for section in sections:
-        lines = section.strip().split('\n')
-        title = lines[0].strip()
-        items = []
-        for item_line in lines[1:]:
-            if '. ' in item_line:
-                full_item = item_line.split('. ', 1)[1].strip()
-                name, description = "", ""
-                
-                if '|' in full_item:
-                    parts = full_item.split('|', 1) # Split into max 2 parts
-                    name = parts[0].strip()
-                    if len(parts) > 1:
-                        description = parts[1].strip()
-                else:
-                    name = full_item
-                
-                items.append({"name": name, "description": description})
-        guide_dict[title] = items
-    return guide_dict
-
-
-def generate_google_maps_link(item, city):
-    """Generates a safe, encoded Google Maps link."""
-    query = f"{item}, {city}"
-    encoded_query = quote_plus(query)
-    # FIX: Corrected the URL from 'httpss.' to 'https://'
-    return f"https://www.google.com/maps/search/?api=1&query={encoded_query}"
+        return translations[lang_code]["guide_error"].format(e=e)
+
+    # Only finished, parseable guides are cached
+    if not is_complete_guide(guide_text, finish_reason):
+        return guide_text
+    with lock:
+        guide_cache[key] = guide_text
+    disk_cache.set(key, guide_text, expire=GUIDE_CACHE_EXPIRE)
+    return guide_text
+
+async def fetch_city_info(city_key, city_name, lang_code, on_weather, on_summary, on_guide_update):
+    """Runs the weather, summary and guide lookups concurrently, passing each result to its callback."""
+    async def lookup(func, on_done, *args):
+        result = await asyncio.to_thread(func, *args)
+        on_done(result)
+        return result
+
+    return await asyncio.gather(
+        lookup(get_weather_info, on_weather, city_key, city_name, WEATHER_API_KEY),
+        lookup(get_city_summary, on_summary, city_key, city_name, lang_code),
+        generate_travel_guide(city_key, lang_code, on_guide_update),
+    )
+
+def layout_result_slots():
+    """Reserves the weather, summary and guide slots, in page order."""
+    return st.empty(), st.empty(), st.empty()
+
+def draw_weather_card(slot, city_name, weather, texts):
+    """Draws the weather card and flights link into its slot."""
+    display_city = city_name.title()
+    # Each "card_*" key becomes a st-key-card_* class that style.css targets
+    with slot.container(border=True, key="card_weather"):
+        st.markdown(f"**{texts['weather_header'].format(city_name=display_city)}**")
+        st.write(weather)
+        
+        flight_link = generate_flight_search_link(city_name)
+        st.markdown(f"<a href='{flight_link}' target='_blank' style='display:inline-block; margin-top:10px; padding:8px 16px; background-color:#2563EB; color:white; border-radius:10px; text-decoration:none;'>{texts['flights_button'].format(city_name=display_city)}</a>", unsafe_allow_html=True)
+
+def draw_summary_card(slot, city_name, summary, texts):
+    """Draws the Wikipedia summary card into its slot."""
+    with slot.container(border=True, key="card_summary"):
+        st.subheader(texts["summary_header"].format(city_name=city_name.title()))
+        st.write(summary)
+
+def draw_guide(slot, guide, guide_text, texts):
+    """Draws the guide card into its slot, replacing the streamed text."""
+    with slot.container():
+        # An empty parse means Groq failed (guide_text holds the translated error)
+        if not guide:
+            st.error(guide_text)
+            return
+
+        with st.container(border=True, key="card_guide"):
+            for category, items in guide.items():
+                st.subheader(category)
+                for item in items:
+                    # UPDATED: Display name and description
+                    st.markdown(f"#### [{item.name}]({item.map_url})")
+                    st.write(item.description)
+                    st.divider() # Add a line between items
+        
+        st.success(texts["success"])
+
+def render_results(result, texts):
+    """Draws the weather, summary and guide cards for one finished lookup."""
+    weather_slot, summary_slot, guide_slot = layout_result_slots()
+    draw_weather_card(weather_slot, result["city"], result["weather"], texts)
+    draw_summary_card(summary_slot, result["city"], result["summary"], texts)
+    draw_guide(guide_slot, result["guide"], result["guide_text"], texts)
+
+@st.cache_resource
+def load_css():
+    """Reads the app stylesheet that sits next to this file."""
+    return (Path(__file__).parent / "style.css").read_text(encoding="utf-8")
 
 # --- STREAMLIT UI ---
 
 st.set_page_config(page_title="Trip Whisperer", page_icon="✈️", layout="wide")
 
-st.markdown("""
-<style>
-    @import url('https://fonts.googleapis.com/css2?family=Poppins:wght@400;500;600;700&display=swap');
-    html, body, [class*="st-"] { font-family: 'Poppins', sans-serif; }
-    .stApp { background-color: #0E117; }
-    .block-container { max-width: 800px; padding-top: 2rem; padding-bottom: 2rem; }
-    h1, h2, h3, p, .stMarkdown, .stTextInput>label { color: #FFFFFF; }
-    h1 { text-align: center; }
-    .stTextInput>div>div>input { border-radius: 15px; border: 1px solid #30363F; background-color: #0E117; color: #FFFFFF; padding: 12px; }
-    .stButton>button { width: 100%; border-radius: 15px; border: none; background-color: #007BFF; color: white; padding: 12px; transition: background-color 0.3s ease; }
-    .stButton>button:hover { background-color: #0056b3; }
-    .card { background-color: #161B22; border: 1px solid #30363F; border-radius: 15px; padding: 25px; box-shadow: 0 4px 12px rgba(0,0,0,0.2); margin-bottom: 25px; }
-    .card h3 { color: #58A6FF; border-bottom: 1px solid #30363F; padding-bottom: 10px; }
-    .card a { color: #58A6FF; text-decoration: none; }
-    .card a:hover { text-decoration: underline; color: #80BFFF; }
-    #MainMenu, footer, header { visibility: hidden; }
-</style>
-""", unsafe_allow_html=True)
+# Emitted on every run, since Streamlit drops elements a rerun doesn't write
+st.markdown(f"<style>{load_css()}</style>", unsafe_allow_html=True)
 
 # --- Main Application Flow ---
 
 # NEW: Language selection box
-language_options = {texts["lang_name"]: code for code, texts in translations.items()}
 selected_language_name = st.selectbox(
     label=translations["en"]["lang_select"], # Label is always in English
-    options=language_options.keys(),
+    options=LANGUAGE_OPTIONS.keys(),
     index=0 
 )
-selected_lang_code = language_options[selected_language_name]
+selected_lang_code = LANGUAGE_OPTIONS[selected_language_name]
 
 # NEW: Get the correct UI text from the dictionary
 ui_texts = translations[selected_lang_code]
@@ -270,51 +284,45 @@ city_input = st.text_input(
     placeholder=ui_texts["placeholder"]
 )
 
-if st.button(ui_texts["button"]) and city_input:
-    
-    cleaned_city_name = city_input.strip().strip(string.punctuation)
+cleaned_city_name = clean_city_name(city_input)
+# Lowercased so "Paris" and "paris" share one cache entry
+city_key = cleaned_city_name.lower()
+
+# The last successful lookup is kept in session_state and redrawn on reruns
+result_key = (city_key, selected_lang_code)
+result = st.session_state.get("last_result")
+if result is not None and result["key"] != result_key:
+    result = None
+
+if st.button(ui_texts["button"]) and cleaned_city_name and result is None:
     
     with st.spinner(ui_texts["spinner"].format(city_name=cleaned_city_name)):
-        
-        st.markdown("<div class='card'>", unsafe_allow_html=True)
-        weather_info = get_weather_info(cleaned_city_name, WEATHER_API_KEY)
-        st.markdown(f"**{ui_texts['weather_header'].format(city_name=cleaned_city_name.title())}**")
-        st.write(weather_info)
-        
-        flight_link = generate_flight_search_link(cleaned_city_name)
-        st.markdown(f"<a href='{flight_link}' target='_blank' style='display:inline-block; margin-top:10px; padding:8px 16px; background-color:#2563EB; color:white; border-radius:10px; text-decoration:none;'>{ui_texts['flights_button'].format(city_name=cleaned_city_name.title())}</a>", unsafe_allow_html=True)
-        st.markdown("</div>", unsafe_allow_html=True)
-
-        # FIX: Corrected typo 'class'card'
-        st.markdown("<div class='card'>", unsafe_allow_html=True) 
-        st.subheader(ui_texts["summary_header"].format(city_name=cleaned_city_name.title()))
-        # UPDATED: Pass language code to summary function
-        summary = get_city_summary(cleaned_city_name, selected_lang_code, ui_texts)
-        st.write(summary)
-        st.markdown("</div>", unsafe_allow_html=True)
+        # Weather and summary fill their cards as they arrive; the guide streams below
+        weather_slot, summary_slot, guide_slot = layout_result_slots()
+        weather_info, summary, guide_text = asyncio.run(fetch_city_info(
+            city_key,
+            cleaned_city_name,
+            selected_lang_code,
+            lambda weather: draw_weather_card(weather_slot, cleaned_city_name, weather, ui_texts),
+            lambda summary: draw_summary_card(summary_slot, cleaned_city_name, summary, ui_texts),
+            guide_slot.markdown,
+        ))
 
-        # UPDATED: Pass language code to guide function
-        guide_text = generate_travel_guide(cleaned_city_name, selected_lang_code, ui_texts)
-        
-        if "Could not generate guide" in guide_text:
-            st.error(guide_text)
-        else:
-            parsed_guide = parse_guide_to_dict(guide_text)
-            # FIX: Corrected typo 'class'card'
-            st.markdown("<div class='card'>", unsafe_allow_html=True)
-            
-            for category, items in parsed_guide.items():
-                st.subheader(category)
-                for item in items:
-                    # UPDATED: Display name and description
-                    map_link = generate_google_maps_link(item["name"], cleaned_city_name)
-                    st.markdown(f"#### [{item['name']}]({map_link})")
-                    st.write(item["description"])
-                    st.divider() # Add a line between items
-                    
-            st.markdown("</div>", unsafe_allow_html=True)
-            
-            st.success(ui_texts["success"])
+    result = {
+        "key": result_key,
+        "city": cleaned_city_name,
+        "weather": weather_info,
+        "summary": summary,
+        "guide_text": guide_text,
+        "guide": parse_guide_to_dict(guide_text, cleaned_city_name)
+    }
+    draw_guide(guide_slot, result["guide"], guide_text, ui_texts)
+    # Failed guides are not remembered, so the next click retries
+    if result["guide"]:
+        st.session_state["last_result"] = result
+
+elif result is not None:
+    render_results(result, ui_texts)
 
 # --- NEW: Footer ---
 st.markdown("---")
@@ -0,0 +1,141 @@
+# scripts/warm_cache.py
+
+"""Pre-generates travel guides for popular cities through the Groq batch API.
+
+Run it from the repository root:
+
+    python -m scripts.warm_cache
+    python -m scripts.warm_cache --cities Paris Tokyo --languages en fr
+"""
+
+import argparse
+import os
+import time
+
+import diskcache
+import groq
+import orjson
+from dotenv import load_dotenv
+
+from trip_whisperer.core import (
+    GUIDE_MODEL,
+    GUIDE_COMPLETION_OPTIONS,
+    GUIDE_CACHE_DIR,
+    GUIDE_CACHE_EXPIRE,
+    build_guide_messages,
+    clean_city_name,
+    guide_cache_key,
+    is_complete_guide,
+)
+from trip_whisperer.translations import translations
+
+POPULAR_CITIES = [
+    "Paris", "London", "New York", "Tokyo", "Rome", "Barcelona", "Dubai", "Singapore",
+    "Istanbul", "Bangkok", "Amsterdam", "Prague", "Sydney", "Los Angeles", "Hong Kong",
+    "Madrid", "Berlin", "Vienna", "Lisbon", "Mumbai", "Delhi", "Jaipur", "Goa", "Bali",
+    "Cairo", "Rio de Janeiro", "Mexico City", "San Francisco", "Kyoto", "Seoul",
+]
+
+# Batch states after which nothing more will happen
+FINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+def build_batch_input(pairs):
+    """Returns the batch input file as UTF-8 JSONL: one chat-completion request per (city, language)."""
+    lines = []
+    for city_name, lang_code in pairs:
+        lines.append(orjson.dumps({
+            # The cache key doubles as the request id, so results map straight back
+            "custom_id": guide_cache_key(city_name, lang_code),
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {
+                "model": GUIDE_MODEL,
+                "messages": build_guide_messages(city_name, lang_code),
+                **GUIDE_COMPLETION_OPTIONS,
+            },
+        }))
+    return b"\n".join(lines) + b"\n"
+
+
+def wait_for_batch(client, batch_id, poll_interval):
+    """Polls the batch until it reaches a final state and returns it."""
+    while True:
+        batch = client.batches.retrieve(batch_id)
+        if batch.status in FINAL_STATUSES:
+            return batch
+        print(f"Batch {batch_id} is {batch.status}, checking again in {poll_interval}s...")
+        time.sleep(poll_interval)
+
+
+def store_results(output_text, disk_cache):
+    """Writes every complete guide in the batch output to the cache and returns the count."""
+    stored = 0
+    for line in output_text.splitlines():
+        if not line.strip():
+            continue
+        result = orjson.loads(line)
+        response = result.get("response") or {}
+        if response.get("status_code") != 200:
+            print(f"Skipping {result.get('custom_id')}: {result.get('error') or response}")
+            continue
+        choice = response["body"]["choices"][0]
+        guide_text = choice["message"]["content"]
+        # Same check app.py applies before caching
+        if not is_complete_guide(guide_text, choice.get("finish_reason")):
+            print(f"Skipping {result['custom_id']}: incomplete guide (finish_reason {choice.get('finish_reason')!r})")
+            continue
+        disk_cache.set(result["custom_id"], guide_text, expire=GUIDE_CACHE_EXPIRE)
+        stored += 1
+    return stored
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Warm the Trip Whisperer guide cache via the Groq batch API.")
+    parser.add_argument("--cities", nargs="+", default=POPULAR_CITIES, help="Cities to generate guides for.")
+    parser.add_argument("--languages", nargs="+", default=list(translations), choices=list(translations),
+                        help="Language codes to generate guides in.")
+    parser.add_argument("--poll-interval", type=int, default=30, help="Seconds between batch status checks.")
+    args = parser.parse_args()
+
+    load_dotenv()
+    api_key = os.getenv("GROQ_API_KEY")
+    if not api_key:
+        raise SystemExit("Groq API key not found. Please check your .env file.")
+
+    disk_cache = diskcache.Cache(str(GUIDE_CACHE_DIR))
+    # Cities are cleaned and lowercased the same way app.py builds its cache key
+    city_keys = [clean_city_name(city_name).lower() for city_name in args.cities]
+    pairs = [
+        (city_key, lang_code)
+        for city_key in city_keys
+        for lang_code in args.languages
+        if guide_cache_key(city_key, lang_code) not in disk_cache
+    ]
+    if not pairs:
+        print("Every requested guide is already cached.")
+        return
+
+    client = groq.Groq(api_key=api_key)
+    input_file = client.files.create(
+        file=("warm_cache.jsonl", build_batch_input(pairs)),
+        purpose="batch",
+    )
+    batch = client.batches.create(
+        completion_window="24h",
+        endpoint="/v1/chat/completions",
+        input_file_id=input_file.id,
+    )
+    print(f"Submitted batch {batch.id} with {len(pairs)} guides.")
+
+    batch = wait_for_batch(client, batch.id, args.poll_interval)
+    if batch.status != "completed" or not batch.output_file_id:
+        raise SystemExit(f"Batch {batch.id} ended with status '{batch.status}'.")
+
+    output_text = client.files.content(batch.output_file_id).read().decode("utf-8")
+    stored = store_results(output_text, disk_cache)
+    print(f"Cached {stored} of {len(pairs)} guides.")
+
+
+if __name__ == "__main__":
+    main()
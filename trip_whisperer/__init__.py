@@ -0,0 +1 @@
+"""Shared pieces of Trip Whisperer that don't depend on Streamlit."""
@@ -0,0 +1,127 @@
+# trip_whisperer/core.py
+
+"""Guide prompt, model settings, cache keys and parsing shared by app.py and scripts/warm_cache.py."""
+
+import functools
+import hashlib
+import string
+from collections import namedtuple
+from pathlib import Path
+from urllib.parse import quote_plus
+
+from trip_whisperer.translations import LANG_NAME_BY_CODE
+
+GUIDE_MODEL = "llama-3.1-8b-instant"
+# Part of the persistent cache key; bump it to retire guides from an older prompt
+PROMPT_VERSION = "v5"
+
+# Greedy decoding, so one cached guide per (city, language) fits every user
+GUIDE_COMPLETION_OPTIONS = {
+    "temperature": 0,
+    "top_p": 1,
+    # Above a full 15-item guide in any language
+    "max_tokens": 3072,
+}
+
+# On-disk guide cache, shared by the app and the cache-warming script
+GUIDE_CACHE_DIR = Path(__file__).resolve().parent.parent / ".groq_cache"
+GUIDE_CACHE_EXPIRE = 7 * 86400
+
+# Stripped from both ends of the city input; inner punctuation ("St. Louis") is kept
+CITY_STRIP_CHARS = string.whitespace + string.punctuation
+
+
+# UPDATED: New prompt for 5 items, new categories, and language support
+def build_guide_messages(city_name, lang_code):
+    """Builds the chat messages that ask Groq for a travel guide in the given language."""
+    lang_name = LANG_NAME_BY_CODE.get(lang_code, "English")
+
+    # Static text first and the city last, so requests share the longest prefix
+    system = (
+        "You are a helpful travel assistant. "
+        f"You MUST respond in this language: {lang_name} (language code: {lang_code})."
+    )
+    prompt = (
+        f"Use these three headings (translated to {lang_name}), each followed by exactly 5 numbered items:\n"
+        "### Top 5 Tourist Attractions\n"
+        "### Top 5 Local Dishes to Try\n"
+        "### Top 5 Things to Avoid\n"
+        f"Format every item as: N. Name in local language | A brief, 3-sentence description in {lang_name}\n"
+        "\n"
+        "Example (for Paris in English):\n"
+        "### Top 5 Tourist Attractions\n"
+        "1. Eiffel Tower | A famous 19th-century iron lattice tower. It is one of the most recognizable "
+        "structures in the world. Visitors can ride an elevator to the top for breathtaking views of the city.\n"
+        "\n"
+        f'Create a concise and exciting travel guide for "{city_name}".'
+    )
+    return [
+        {"role": "system", "content": system},
+        {"role": "user", "content": prompt}
+    ]
+
+
+def clean_city_name(city_input):
+    """Trims whitespace and stray punctuation from a user-entered city name."""
+    cleaned = city_input
+    # Bare strip() also covers Unicode spaces (NBSP, U+3000) that string.whitespace lacks
+    while (stripped := cleaned.strip().strip(CITY_STRIP_CHARS)) != cleaned:
+        cleaned = stripped
+    # Keep the final dot of an initialism such as "D.C."
+    if cleaned[-2:-1] == "." and cleaned[-1:].isalpha():
+        end = city_input.find(cleaned) + len(cleaned)
+        if city_input[end:end + 1] == ".":
+            cleaned += "."
+    return cleaned
+
+
+def guide_cache_key(city_name, lang_code):
+    """Key for one guide, tied to the model and prompt version that produced it."""
+    return hashlib.sha256(f"{city_name}|{lang_code}|{GUIDE_MODEL}|{PROMPT_VERSION}".encode()).hexdigest()
+
+
+@functools.lru_cache(maxsize=512)
+def _qp(text):
+    """Memoized quote_plus."""
+    return quote_plus(text)
+
+
+def generate_flight_search_link(city_name):
+    """Generates a pre-filled Google Flights search link."""
+    return f"https://www.google.com/search?q=flights+to+{_qp(city_name)}"
+
+
+def generate_google_maps_link(item, city):
+    """Generates a safe, encoded Google Maps link."""
+    # "%2C+" is quote_plus(", "), so this matches encoding "{item}, {city}" in one go
+    return f"https://www.google.com/maps/search/?api=1&query={_qp(item)}%2C+{_qp(city)}"
+
+
+# One guide entry, with its maps link built at parse time
+Item = namedtuple("Item", "name description map_url")
+
+
+def parse_guide_to_dict(guide_text, city_name):
+    """Parses the raw text output from the AI into a dictionary of Item lists."""
+    # Headings open sections and "N. Name | Description" lines add items; anything else is skipped
+    guide_dict = {}
+    items = None
+    for line in guide_text.splitlines():
+        line = line.strip()
+        if line.startswith("#"):
+            title = line.lstrip("#").strip(" *")
+            items = guide_dict.setdefault(title, []) if title else None
+        elif items is not None and line[:1].isdigit():
+            number, dot, rest = line.partition(".")
+            if not dot or not number.isdigit():
+                continue
+            name, _, description = rest.partition("|")
+            name = name.strip(" *")
+            if name:
+                items.append(Item(name, description.strip(), generate_google_maps_link(name, city_name)))
+    return {title: items for title, items in guide_dict.items() if items}
+
+
+def is_complete_guide(guide_text, finish_reason):
+    """Whether a generated guide is fit to cache: it ran to the end and has at least one item."""
+    return finish_reason == "stop" and bool(parse_guide_to_dict(guide_text, ""))
@@ -0,0 +1,71 @@
+# trip_whisperer/translations.py
+
+"""UI strings for every supported language, plus lookup tables derived from them."""
+
+# --- NEW: TRANSLATIONS DICTIONARY ---
+translations = {
+    "en": {
+        "title": "Trip Whisperer: Your AI Travel Companion ✈️",
+        "placeholder": "e.g., Paris, Tokyo, New York",
+        "button": "Generate Guide",
+        "spinner": "Conjuring a travel guide for {city_name}... ✨",
+        "weather_header": "Current Weather in {city_name}:",
+        "flights_button": "Search for Flights to {city_name}",
+        "summary_header": "A Glimpse into {city_name}",
+        "summary_error": "Could not find a Wikipedia summary for '{city_name}' (language: {lang_code}).",
+        "guide_error": "Could not generate guide. AI model error: {e}",
+        "success": "Your personalized travel guide is ready! Click any item to explore it on Google Maps.",
+        "lang_name": "English",
+        "lang_select": "Select Language",
+        "footer": "Created by Sheikh Imran © 2025. All rights reserved."
+    },
+    "es": {
+        "title": "Susurrador de Viajes: Tu Compañero de IA ✈️",
+        "placeholder": "ej., París, Tokio, Nueva York",
+        "button": "Generar Guía",
+        "spinner": "Conjurando una guía de viaje para {city_name}... ✨",
+        "weather_header": "Tiempo actual en {city_name}:",
+        "flights_button": "Buscar Vuelos a {city_name}",
+        "summary_header": "Un Vistazo a {city_name}",
+        "summary_error": "No se pudo encontrar un resumen de Wikipedia para '{city_name}' (idioma: {lang_code}).",
+        "guide_error": "No se pudo generar la guía. Error del modelo de IA: {e}",
+        "success": "¡Tu guía de viaje personalizada está lista! Haz clic en cualquier elemento para explorarlo en Google Maps.",
+        "lang_name": "Español",
+        "lang_select": "Seleccionar Idioma",
+        "footer": "Creado por Sheikh Imran © 2025. Todos los derechos reservados."
+    },
+    "hi": {
+        "title": "ट्रिप व्हिस्परर: आपका AI यात्रा साथी ✈️",
+        "placeholder": "जैसे, पेरिस, टोक्यो, न्यूयॉर्क",
+        "button": "गाइड तैयार करें",
+        "spinner": "{city_name} के लिए एक यात्रा गाइड तैयार की जा रही है... ✨",
+        "weather_header": "{city_name} में वर्तमान मौसम:",
+        "flights_button": "{city_name} के लिए उड़ानें खोजें",
+        "summary_header": "{city_name} की एक झलक",
+        "summary_error": "'{city_name}' के लिए विकिपीडिया सारांश नहीं मिल सका (भाषा: {lang_code}).",
+        "guide_error": "गाइड उत्पन्न नहीं हो सका। AI मॉडल त्रुटि: {e}",
+        "success": "आपकी व्यक्तिगत यात्रा गाइड तैयार है! Google मानचित्र पर इसका पता लगाने के लिए किसी भी आइटम पर क्लिक करें।",
+        "lang_name": "हिंदी",
+        "lang_select": "भाषा चुनें",
+        "footer": "शेख इमरान द्वारा निर्मित © 2025. सर्वाधिकार सुरक्षित।"
+    },
+    "fr": {
+        "title": "Murmure de Voyage : Votre Compagnon IA ✈️",
+        "placeholder": "ex: Paris, Tokyo, New York",
+        "button": "Générer le Guide",
+        "spinner": "Préparation d'un guide de voyage pour {city_name}... ✨",
+        "weather_header": "Météo actuelle à {city_name} :",
+        "flights_button": "Rechercher des vols vers {city_name}",
+        "summary_header": "Un aperçu de {city_name}",
+        "summary_error": "Impossible de trouver un résumé Wikipedia pour '{city_name}' (langue : {lang_code}).",
+        "guide_error": "Impossible de générer le guide. Erreur du modèle IA : {e}",
+        "success": "Votre guide de voyage personnalisé est prêt ! Cliquez sur un élément pour l'explorer sur Google Maps.",
+        "lang_name": "Français",
+        "lang_select": "Choisir la langue",
+        "footer": "Créé par Sheikh Imran © 2025. Tous droits réservés."
+    }
+}
+
+# Lookup tables derived from the translations
+LANGUAGE_OPTIONS = {texts["lang_name"]: code for code, texts in translations.items()}
+LANG_NAME_BY_CODE = {code: texts["lang_name"] for code, texts in translations.items()}